@@ -15,6 +15,8 @@ functions. The basic data object classes are:
   :attr:`nda` attribute.
 * :class:`.ArrayOfEqualSizedArrays`: multi-dimensional :class:`numpy.ndarray`.
   Access data via the :attr:`nda` attribute.
+* :class:`.LazyArray`: :class:`.Array` whose data is computed on first access
+  of the :attr:`nda` attribute.
 * :class:`.VectorOfVectors`: a variable length array of variable length arrays.
   Implemented as a pair of :class:`.Array`: :attr:`flattened_data` holding the
   raw data, and :attr:`cumulative_length` whose ith element is the sum of the
@@ -33,6 +35,7 @@ browsed easily in python like any `HDF5 <https://www.hdfgroup.org>`_ file using
 from pygama.lgdo.array import Array
 from pygama.lgdo.arrayofequalsizedarrays import ArrayOfEqualSizedArrays
 from pygama.lgdo.fixedsizearray import FixedSizeArray
+from pygama.lgdo.lazyarray import LazyArray
 from pygama.lgdo.lgdo import LGDO
 from pygama.lgdo.lh5_store import LH5Iterator, LH5Store, load_dfs, load_nda, ls, show
 from pygama.lgdo.scalar import Scalar
@@ -51,6 +54,7 @@ __all__ = [
     "Array",
     "ArrayOfEqualSizedArrays",
     "FixedSizeArray",
+    "LazyArray",
     "LGDO",
     "Scalar",
     "Struct",
@@ -0,0 +1,85 @@
+"""
+Implements a LEGEND Data Object representing an array whose data is computed
+on first access and corresponding utilities.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+import numpy as np
+
+from pygama.lgdo.array import Array
+from pygama.lgdo.lgdo import LGDO
+from pygama.lgdo.lgdo_utils import get_element_type
+
+log = logging.getLogger(__name__)
+
+
+class LazyArray(Array):
+    """An :class:`.Array` whose data is only computed when first accessed.
+
+    Holds a function producing the :class:`numpy.ndarray` together with the
+    shape and data type of its result, so that the object can be sized (e.g.
+    as a :class:`.Table` column) without running the computation. The array
+    is computed the first time the :attr:`nda` attribute is accessed and kept
+    afterwards.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[], np.ndarray],
+        shape: tuple[int, ...],
+        dtype: np.dtype,
+        attrs: dict[str, Any] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        compute
+            function without arguments returning the array data.
+        shape
+            the shape of the array returned by `compute`.
+        dtype
+            the data type of the array returned by `compute`.
+        attrs
+            A set of user attributes to be carried along with this LGDO.
+        """
+        self._compute = compute
+        self._nda = None
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+
+        LGDO.__init__(self, attrs)
+
+    @property
+    def nda(self) -> np.ndarray:
+        """The array data, computed on first access."""
+        if self._nda is None:
+            nda = self._compute()
+            if nda.shape != self.shape or nda.dtype != self.dtype:
+                raise ValueError(
+                    f"computed array with shape {nda.shape} and dtype {nda.dtype} "
+                    f"does not match the expected {self.shape} and {self.dtype}"
+                )
+            self.nda = nda
+
+        return self._nda
+
+    @nda.setter
+    def nda(self, nda: np.ndarray) -> None:
+        self._nda = nda
+        self._compute = None
+
+    def is_computed(self) -> bool:
+        """Whether the array data has been computed already."""
+        return self._nda is not None
+
+    def form_datatype(self) -> str:
+        dt = self.datatype_name()
+        nd = str(len(self.shape))
+        et = get_element_type(self)
+        return dt + "<" + nd + ">{" + et + "}"
+
+    def __len__(self) -> int:
+        return len(self._nda) if self._nda is not None else self.shape[0]
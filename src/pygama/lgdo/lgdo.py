@@ -7,6 +7,9 @@ from typing import Any
 class LGDO(ABC):
     """Abstract base class representing a LEGEND Data Object (LGDO)."""
 
+    # no instance dictionary is imposed on derived classes (see Struct)
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, attrs: dict[str, Any] | None = None) -> None:
         self.attrs = {} if attrs is None else dict(attrs)
@@ -1240,21 +1240,20 @@ class LH5Iterator:
                     self.entry_list[i_file] = list(local_list)
 
         elif entry_mask is not None:
-            # Convert entry mask into an entry list
-            if isinstance(entry_mask, pd.Series):
-                entry_mask = entry_mask.values
-            if isinstance(entry_mask, np.ndarray):
+            # Convert entry mask into an entry list (one index array per file)
+            if isinstance(entry_mask, (pd.Series, np.ndarray)):
+                entry_mask = np.asarray(entry_mask, dtype=bool)
                 self.entry_list = []
                 f_start = 0
                 for f_end in self.file_map:
-                    self.entry_list.append(
-                        list(np.nonzero(entry_mask[f_start:f_end])[0])
-                    )
+                    self.entry_list.append(np.flatnonzero(entry_mask[f_start:f_end]))
                     f_start = f_end
             else:
                 self.entry_list = [[]] * len(self.file_map)
                 for i_file, local_mask in enumerate(entry_mask):
-                    self.entry_list[i_file] = list(np.nonzero(local_mask)[0])
+                    self.entry_list[i_file] = np.flatnonzero(
+                        np.asarray(local_mask, dtype=bool)
+                    )
 
         # Map to last entry of each file
         self.entry_map = (
@@ -23,6 +23,9 @@ class Struct(LGDO, dict):
 
     # TODO: overload setattr to require add_field for setting?
 
+    # avoid a per-instance __dict__ on top of the dict itself
+    __slots__ = ("attrs",)
+
     def __init__(
         self, obj_dict: dict[str, LGDO] = None, attrs: dict[str, Any] = None
     ) -> None:
@@ -4,30 +4,269 @@ equal length and corresponding utilities.
 """
 from __future__ import annotations
 
+import ast
+import keyword
 import logging
 import re
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable
 
+import numba as nb
 import numexpr as ne
 import numpy as np
 import pandas as pd
+from numexpr.necompiler import getExprNames, getType
 from pandas.io.formats import format as fmt
 
 from pygama.lgdo.array import Array
 from pygama.lgdo.arrayofequalsizedarrays import ArrayOfEqualSizedArrays
+from pygama.lgdo.lazyarray import LazyArray
 from pygama.lgdo.lgdo import LGDO
 from pygama.lgdo.struct import Struct
 from pygama.lgdo.vectorofvectors import VectorOfVectors
 
 log = logging.getLogger(__name__)
 
+# per-thread cache of compiled numexpr programs, see _numexpr_programs()
+_numexpr_local = threading.local()
+
+# thread pool used by Table.eval and its number of threads, see _thread_pool()
+_eval_pool = (0, None)
+_eval_pool_lock = threading.Lock()
+
+# Numba kernels compiled by Table.eval(engine="numba"), keyed by expression,
+# argument names and argument types
+_numba_kernels = {}
+
+
+def _dependency_layers(deps: dict[str, set[str]]) -> list[list[str]]:
+    """Sort the keys of `deps` into layers, each layer holding only keys that
+    depend exclusively on keys from previous layers.
+
+    Parameters
+    ----------
+    deps
+        maps each key to the set of keys it depends on.
+    """
+    layers = []
+    done = set()
+    todo = list(deps)
+    while todo:
+        layer = [k for k in todo if deps[k] <= done]
+        if not layer:
+            raise ValueError(f"circular dependency between {todo}")
+        layers.append(layer)
+        done.update(layer)
+        todo = [k for k in todo if k not in done]
+
+    return layers
+
+
+@lru_cache(maxsize=256)
+def _numexpr_names(expression: str) -> tuple[tuple[str, ...], bool]:
+    """Get the variable names used in a :mod:`numexpr` `expression` and
+    whether it uses VML functions."""
+    names, ex_uses_vml = getExprNames(expression, {})
+    return tuple(names), ex_uses_vml
+
+
+def _numexpr_programs() -> Callable[..., ne.NumExpr]:
+    """Get the cache of compiled :mod:`numexpr` programs of the current thread.
+
+    A compiled program must not run in two threads at once, so (like
+    :func:`numexpr.evaluate`) each thread keeps its own.
+    """
+    try:
+        return _numexpr_local.compile
+    except AttributeError:
+        _numexpr_local.compile = lru_cache(maxsize=256)(ne.NumExpr)
+        return _numexpr_local.compile
+
+
+def _numexpr_compile(
+    expression: str, signature: tuple[tuple[str, type], ...]
+) -> ne.NumExpr:
+    """Compile `expression` for the input types in `signature`."""
+    return _numexpr_programs()(expression, signature)
+
+
+def _numexpr_evaluate(
+    expression: str, local_dict: dict[str, Any], out: np.ndarray = None
+) -> np.ndarray:
+    """Evaluate `expression` like :func:`numexpr.evaluate`, but reuse the
+    compiled program across calls.
+
+    Parsing and compiling is done once per expression and set of input types,
+    later calls go straight to the :mod:`numexpr` virtual machine.
+
+    Parameters
+    ----------
+    expression
+        a :mod:`numexpr` expression.
+    local_dict
+        the arrays and scalar parameters used in `expression`.
+    out
+        if not ``None``, the result is written into this array.
+    """
+    names, ex_uses_vml = _numexpr_names(expression)
+    args = [np.asarray(local_dict[name]) for name in names]
+    signature = tuple((name, getType(arg)) for name, arg in zip(names, args))
+
+    return _numexpr_compile(expression, signature)(
+        *args, out=out, ex_uses_vml=ex_uses_vml
+    )
+
+
+# syntax allowed in Numba expressions: arithmetic, comparisons, boolean
+# operators and calls to NumPy ufuncs
+_numba_nodes = (
+    ast.Expression,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.BoolOp,
+    ast.Call,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+    ast.boolop,
+)
+
+
+def _numba_parse(expression: str, args: tuple[str, ...]) -> tuple[str, dict[str, Any]]:
+    """Check that `expression` only uses the syntax allowed for the Numba
+    engine and get its normalized source, together with the :mod:`numpy`
+    objects it refers to.
+
+    The expression ends up in generated code, so anything but arithmetic,
+    comparisons, boolean operators, calls to :mod:`numpy` ufuncs (e.g.
+    ``sqrt``) and :mod:`numpy` constants (e.g. ``pi``) is rejected with a
+    :class:`ValueError`.
+
+    Parameters
+    ----------
+    expression
+        a Python expression acting on scalars.
+    args
+        the names of the kernel arguments.
+    """
+    for arg in args:
+        if not arg.isidentifier() or keyword.iskeyword(arg):
+            raise ValueError(f"invalid variable name '{arg}'")
+
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"invalid expression '{expression}': {e}") from e
+
+    namespace = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, _numba_nodes):
+            raise ValueError(
+                f"{type(node).__name__} not allowed in expression '{expression}'"
+            )
+        if isinstance(node, ast.Constant) and not isinstance(
+            node.value, (int, float, complex)
+        ):
+            raise ValueError(f"constant {node.value!r} not allowed in '{expression}'")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.keywords:
+                raise ValueError(
+                    f"only positional calls to NumPy ufuncs allowed in '{expression}'"
+                )
+            if node.func.id in args or not isinstance(
+                getattr(np, node.func.id, None), np.ufunc
+            ):
+                raise ValueError(f"unknown function '{node.func.id}' in '{expression}'")
+        if isinstance(node, ast.Name) and node.id not in args:
+            obj = getattr(np, node.id, None)
+            if not isinstance(obj, (np.ufunc, float)):
+                raise ValueError(f"unknown name '{node.id}' in '{expression}'")
+            namespace[node.id] = obj
+
+    return ast.unparse(tree), namespace
+
+
+def _thread_pool(n_threads: int) -> ThreadPoolExecutor:
+    """Get the pool of `n_threads` threads used by :meth:`Table.eval`.
+
+    The pool is kept across calls, so that its threads keep their compiled
+    :mod:`numexpr` programs (see :func:`_numexpr_programs`). Only one pool
+    exists at a time: it is replaced when a different number of threads is
+    requested. The previous pool is dropped rather than shut down, since
+    other calls might still be using it. Its threads exit once it is garbage
+    collected.
+    """
+    global _eval_pool
+    with _eval_pool_lock:
+        if _eval_pool[0] != n_threads:
+            _eval_pool = (n_threads, ThreadPoolExecutor(max_workers=n_threads))
+        return _eval_pool[1]
+
+
+def _numba_evaluate(
+    expression: str, local_dict: dict[str, Any], out: np.ndarray = None
+) -> np.ndarray:
+    """Evaluate an element-wise `expression` with a compiled Numba kernel.
+
+    The expression is compiled into a parallel :func:`numba.vectorize` ufunc
+    taking the variables in `local_dict` as arguments. Kernels are cached for
+    the rest of the session, unknown names are looked up in :mod:`numpy`
+    (e.g. ``sqrt`` or ``pi``). Expressions are checked with
+    :func:`_numba_parse` before being compiled.
+
+    Parameters
+    ----------
+    expression
+        a Python expression acting on scalars.
+    local_dict
+        the arrays and scalar parameters used in `expression`.
+    out
+        if not ``None``, the result is written into this array.
+    """
+    args = tuple(sorted(local_dict))
+    types = tuple(nb.from_dtype(np.asarray(local_dict[a]).dtype) for a in args)
+
+    key = (expression, args, types)
+    if key not in _numba_kernels:
+        source, namespace = _numba_parse(expression, args)
+        exec(f"def _kernel({', '.join(args)}):\n    return {source}\n", namespace)
+        kernel = namespace["_kernel"]
+
+        # parallel ufuncs need an explicit signature: get the return type
+        # from a scalar compilation first
+        scalar_kernel = nb.njit(fastmath=True)(kernel)
+        scalar_kernel.compile(types)
+        ret_type = scalar_kernel.overloads[types].signature.return_type
+
+        _numba_kernels[key] = nb.vectorize(
+            [ret_type(*types)], target="parallel", fastmath=True
+        )(kernel)
+
+    return _numba_kernels[key](*[local_dict[a] for a in args], out=out)
+
+
+def _evaluate(
+    expression: str, local_dict: dict[str, Any], engine: str, out: np.ndarray = None
+) -> np.ndarray:
+    """Evaluate `expression` with the given `engine` (see :meth:`Table.eval`)."""
+    if engine == "numexpr":
+        return _numexpr_evaluate(expression, local_dict, out=out)
+
+    return _numba_evaluate(expression, local_dict, out=out)
+
 
 class Table(Struct):
     """A special struct of arrays or subtable columns of equal length.
 
     Holds onto an internal read/write location ``loc`` that is useful in
     managing table I/O using functions like :meth:`push_row`, :meth:`is_full`,
-    and :meth:`clear`.
+    :meth:`advance` and :meth:`clear`.
 
     Note
     ----
@@ -38,6 +277,10 @@ class Table(Struct):
 
     # TODO: overload getattr to allow access to fields as object attributes?
 
+    # fixed set of attributes: saves the instance __dict__ and speeds up
+    # attribute access (e.g. in push_row() and is_full())
+    __slots__ = ("size", "loc")
+
     def __init__(
         self,
         size: int = None,
@@ -72,8 +315,12 @@ class Table(Struct):
         # if size is also supplied, resize all fields to match it
         # otherwise, warn if the supplied fields have varying size
         if col_dict is not None and len(col_dict) > 0:
-            do_warn = True if size is None else False
-            self.resize(new_size=size, do_warn=do_warn)
+            # nothing to resize if all fields already have the requested size
+            if size is not None and all(len(obj) == size for obj in col_dict.values()):
+                self.size = size
+            else:
+                do_warn = True if size is None else False
+                self.resize(new_size=size, do_warn=do_warn)
 
         # if no col_dict, just set the size (default to 1024)
         else:
@@ -91,19 +338,18 @@ class Table(Struct):
 
     def resize(self, new_size: int = None, do_warn: bool = False) -> None:
         # if new_size = None, use the size from the first field
+        if new_size is None:
+            new_size = next((len(obj) for _, obj in self.items()), None)
+
+        # only touch the fields that actually need it
         for field, obj in self.items():
-            if new_size is None:
-                new_size = len(obj)
-            elif len(obj) != new_size:
+            if len(obj) != new_size:
                 if do_warn:
                     log.warning(
                         f"warning: resizing field {field}"
                         f"with size {len(obj)} != {new_size}"
                     )
-                if isinstance(obj, Table):
-                    obj.resize(new_size)
-                else:
-                    obj.resize(new_size)
+                obj.resize(new_size)
         self.size = new_size
 
     def push_row(self) -> None:
@@ -112,6 +358,20 @@ class Table(Struct):
     def is_full(self) -> bool:
         return self.loc >= self.size
 
+    def advance(self, n: int = 1) -> bool:
+        """Move :attr:`loc` forward by `n` rows and return whether the table
+        is full.
+
+        Combines :meth:`push_row` and :meth:`is_full` in a single call, and
+        allows to account for a block of rows filled at once.
+        """
+        self.loc += n
+        return self.loc >= self.size
+
+    def remaining(self) -> int:
+        """Return the number of rows left before the table is full."""
+        return self.size - self.loc
+
     def clear(self) -> None:
         self.loc = 0
 
@@ -135,15 +395,20 @@ class Table(Struct):
             print or don't print useful info. Passed to :meth:`resize` when
             `use_obj_size` is ``True``.
         """
-        if not hasattr(obj, "__len__"):
+        try:
+            n_obj = len(obj)
+        except TypeError:
             raise TypeError("cannot add field of type", type(obj).__name__)
 
         super().add_field(name, obj)
 
-        # check / update sizes
-        if self.size != len(obj):
-            new_size = len(obj) if use_obj_size else self.size
-            self.resize(new_size=new_size)
+        # check / update sizes: the other fields already have the table size,
+        # so only the new one needs resizing unless the table has to follow it
+        if self.size != n_obj:
+            if use_obj_size:
+                self.resize(new_size=n_obj, do_warn=do_warn)
+            else:
+                obj.resize(self.size)
 
     def add_column(
         self, name: str, obj: LGDO, use_obj_size: bool = False, do_warn: bool = True
@@ -182,17 +447,39 @@ class Table(Struct):
             log.warning(f"other_table.loc ({other_table.loc}) != self.loc({self.loc})")
         if cols is None:
             cols = other_table.keys()
-        for name in cols:
-            self.add_column(name, other_table[name], do_warn=do_warn)
+
+        # all columns share the size of other_table: if it matches, add them
+        # at once, without checking each of them
+        if len(other_table) == self.size:
+            self.update({name: other_table[name] for name in cols})
+            self.update_datatype()
+        else:
+            for name in cols:
+                self.add_column(name, other_table[name], do_warn=do_warn)
 
     def get_dataframe(
-        self, cols: list[str] = None, copy: bool = False, prefix: str = ""
+        self,
+        cols: list[str] = None,
+        copy: bool = False,
+        prefix: str = "",
+        view: bool = False,
     ) -> pd.DataFrame:
         """Get a :class:`pandas.DataFrame` from the data in the table.
 
         Notes
         -----
-        The requested data must be array-like, with the ``nda`` attribute.
+        The requested data must be array-like, with the ``nda`` attribute
+        (i.e. :class:`~.Array` or derived classes), :class:`~.VectorOfVectors`
+        (converted with :meth:`~.VectorOfVectors.to_aoesa`) or sub-tables.
+
+        By default, the data is copied into the dataframe (through Python
+        lists, so integer and floating point columns become 64-bit). With
+        `view`, one-dimensional columns are handed to :mod:`pandas` as they
+        are instead: the dataframe shares memory with the table, so it
+        changes whenever the table buffers are re-filled (e.g. by
+        :class:`.LH5Iterator`), and the columns cannot be resized in place
+        (:meth:`resize`, :meth:`.LH5Store.read_object` with `obj_buf`) while
+        the dataframe is alive.
 
         Parameters
         ----------
@@ -201,40 +488,119 @@ class Table(Struct):
             to be added to the dataframe.
         copy
             When ``True``, the dataframe allocates new memory and copies data
-            into it. Otherwise, the raw ``nda``'s from the table are used directly.
+            into it. Only matters together with `view`.
         prefix
             The prefix to be added to the column names. Used when recursively getting the
             dataframe of a Table inside this Table
+        view
+            if ``True`` (and `copy` is ``False``), the raw ``nda``'s of
+            one-dimensional columns are used directly, without any copy or
+            type conversion. Multi-dimensional and
+            :class:`~.VectorOfVectors` columns are always copied.
         """
-        df = pd.DataFrame(copy=copy)
         if cols is None:
             cols = self.keys()
+
+        # check all columns first, before doing any work
+        for col in cols:
+            if not isinstance(self[col], (Array, Table, VectorOfVectors)):
+                raise ValueError(f"column {col} does not have an nda")
+
+        # collect all columns and build the dataframe in one go, instead of
+        # inserting (and consolidating) them one at a time
+        data = {}
         for col in cols:
             if isinstance(self[col], Table):
-                sub_df = self[col].get_dataframe(prefix=f"{prefix}{col}_")
-                if df.empty:
-                    df = sub_df
-                else:
-                    df = df.join(sub_df)
+                sub_df = self[col].get_dataframe(prefix=f"{prefix}{col}_", view=view)
+                data.update(sub_df.items())
             else:
                 if isinstance(self[col], VectorOfVectors):
                     column = self[col].to_aoesa()
                 else:
                     column = self[col]
 
-                if not hasattr(column, "nda"):
-                    raise ValueError(f"column {col} does not have an nda")
+                # 1D arrays can be viewed as they are, anything else is
+                # copied into one list element per row
+                if view and column.nda.ndim == 1:
+                    data[prefix + col] = column.nda
                 else:
-                    df[prefix + col] = column.nda.tolist()
+                    data[prefix + col] = column.nda.tolist()
 
-        return df
+        return pd.DataFrame(data, copy=copy)
 
-    def eval(self, expr_config: dict) -> Table:
+    def to_dict_of_arrays(self, cols: list[str] = None) -> dict[str, np.ndarray]:
+        """Get the ``nda``'s of the table columns, keyed by column name.
+
+        No copy is performed, which makes this suitable for handing the data
+        over to other array libraries (e.g. :func:`cupy.asarray`).
+
+        Parameters
+        ----------
+        cols
+            a list of column names specifying the subset of the table's columns
+            to be returned.
+        """
+        if cols is None:
+            cols = self.keys()
+
+        data = {}
+        for col in cols:
+            if not isinstance(self[col], Array):
+                raise ValueError(f"column {col} does not have an nda")
+            data[col] = self[col].nda
+
+        return data
+
+    def to_ndarray(
+        self, cols: list[str] = None, dtype: np.dtype = None, order: str = "C"
+    ) -> np.ndarray:
+        """Get a two-dimensional :class:`numpy.ndarray` holding the table
+        columns.
+
+        Row ``i`` of the returned array is row ``i`` of the table, with one
+        entry per column. Data is always copied into the new array.
+
+        Parameters
+        ----------
+        cols
+            a list of column names specifying the subset of the table's columns
+            to be added to the array. They must all be one-dimensional.
+        dtype
+            data type of the array. Defaults to the common type of the columns
+            (see :func:`numpy.result_type`).
+        order
+            memory layout of the array. With ``F``, each column is contiguous
+            in memory.
+        """
+        data = self.to_dict_of_arrays(cols)
+        for col, nda in data.items():
+            if nda.ndim != 1:
+                raise ValueError(f"column {col} is not one-dimensional")
+
+        if dtype is None:
+            dtype = np.result_type(*data.values()) if data else np.float64
+
+        # fill the output array directly, avoiding intermediate copies
+        out = np.empty((self.size, len(data)), dtype=dtype, order=order)
+        for i, nda in enumerate(data.values()):
+            out[:, i] = nda
+
+        return out
+
+    def eval(
+        self,
+        expr_config: dict,
+        engine: str = "numexpr",
+        out: Table = None,
+        lazy: bool = False,
+        n_threads: int = 1,
+    ) -> Table:
         """Apply column operations to the table and return a new table holding
         the resulting columns.
 
-        Currently defers all the job to :meth:`numexpr.evaluate`. This
-        might change in the future.
+        Currently defers all the job to :mod:`numexpr` (or :mod:`numba`, see
+        `engine`). Compiled expressions are cached, so repeated calls with the
+        same configuration (e.g. on file chunks) are not parsed again.
 
         Parameters
         ----------
@@ -265,65 +631,229 @@ class Table(Struct):
               <https://numexpr.readthedocs.io/projects/NumExpr3/en/latest/index.html>`_
               for documentation). Note: because of internal limitations, reduction operations must appear the last in the stack.
             - ``parameters`` is a dictionary of function parameters. Passed to
-              :meth:`numexpr.evaluate`` as `local_dict` argument.
+              :meth:`numexpr.evaluate`` as `local_dict` argument. String
+              values are converted to :class:`float`.
+
+        engine
+            the backend used to evaluate the expressions. ``numexpr`` (default)
+            or ``numba``. With ``numba``, each expression is compiled once
+            into a multi-threaded element-wise kernel, which pays off when the
+            same expressions are evaluated repeatedly (e.g. on file chunks).
+            Only element-wise expressions in Python syntax are supported (no
+            reductions). Names that are not columns or parameters are looked up
+            in :mod:`numpy`.
+        out
+            a table with the same size as this one (e.g. the output of a
+            previous call) to which the resulting columns are added and which
+            is returned. Results of blocks matching an existing
+            :class:`~.Array` column of `out` are written directly into its
+            buffer, which must have the right shape and a compatible data type.
+            :class:`~.LazyArray` columns that are not computed yet are
+            replaced instead.
+            Useful to avoid new memory allocations when evaluating the same
+            expressions on multiple tables (e.g. file chunks).
+        lazy
+            if ``True``, one-dimensional results not written into `out` are
+            returned as :class:`~.LazyArray` objects, which are computed only
+            when their data is first accessed (directly or by a dependent
+            block). Results that are never used are then never computed. The
+            input columns must not be modified until then. Results written
+            into `out` are still computed right away. A table holding lazy
+            columns that are not computed yet cannot be pickled.
+        n_threads
+            number of threads evaluating mutually independent blocks
+            concurrently. Only used with the ``numexpr`` engine and if `lazy`
+            is ``False``. Note that :mod:`numexpr` already splits each
+            expression across its own threads (see
+            :func:`numexpr.set_num_threads`), so this mostly helps with many
+            small expressions (e.g. on short tables).
+
+
+        Note
+        ----
+        Blocks in `expr_config` are evaluated in order of mutual dependency,
+        independently of the order in which they are given. Output columns are
+        added in configuration order.
+        """
+        # find all valid python variables in each expression (e.g "a*b+sin(Cool)" --> {'a','b','sin','Cool'})
+        expr_vars = {
+            out_var: {
+                elem.strip()
+                for elem in re.findall(r"\s*[A-Za-z_]\w*\s*", spec["expression"])
+            }
+            for out_var, spec in expr_config.items()
+        }
+
+        # expressions depend on the outputs of other blocks, unless shadowed
+        # by a table column or a parameter
+        deps = {
+            out_var: {
+                elem
+                for elem in expr_vars[out_var]
+                if elem in expr_config
+                and elem != out_var
+                and elem not in self
+                and elem not in spec.get("parameters", {})
+            }
+            for out_var, spec in expr_config.items()
+        }
+
+        if engine not in ["numexpr", "numba"]:
+            raise ValueError(f"unknown engine '{engine}'")
+
+        if out is not None and len(out) != self.size:
+            raise ValueError(f"out table has size {len(out)} != {self.size}")
+
+        # numba's default threading layer does not support kernels launched
+        # from concurrent threads, and lazy arrays are not thread-safe
+        parallel = n_threads > 1 and engine == "numexpr" and not lazy
+
+        # numeric parameters might be given as strings (e.g. in JSON configs)
+        params = {
+            out_var: {
+                k: float(v) if isinstance(v, str) else v
+                for k, v in spec.get("parameters", {}).items()
+            }
+            for out_var, spec in expr_config.items()
+        }
+
+        # namespace shared by all expressions: holds the input buffers and the
+        # outputs of the blocks processed so far (possibly not computed yet)
+        local_dict = {}
+
+        def evaluate_block(
+            out_var: str, out_buf: np.ndarray = None, probe: bool = False
+        ) -> np.ndarray:
+            # evaluate the expression of a block. If probe is True, evaluate
+            # it on empty inputs, just to get the type and shape of the result
+            inputs = {}
+            for elem in expr_vars[out_var]:
+                if elem not in local_dict:
+                    continue
+                value = local_dict[elem]
+                if isinstance(value, LazyArray):
+                    if probe:
+                        value = np.empty((0,) + value.shape[1:], dtype=value.dtype)
+                    else:
+                        value = value.nda
+                elif probe and isinstance(value, np.ndarray):
+                    value = value[:0]
+                inputs[elem] = value
+
+            return _evaluate(
+                expr_config[out_var]["expression"],
+                dict(inputs, **params[out_var]),
+                engine,
+                out=out_buf,
+            )
+
+        out_cols = {}
+        for layer in _dependency_layers(deps):
+            out_bufs = {}
+            for out_var in layer:
+                for elem in expr_vars[out_var]:
+                    # skip already known names and names not coming from dsp (e.g. sin func)
+                    if elem in local_dict or elem not in self:
+                        continue
+                    # No vector of vectors support yet
+                    if isinstance(self[elem], VectorOfVectors):
+                        raise TypeError(
+                            "Data of type VectorOfVectors not supported (yet)"
+                        )
+                    # get the nda if it is an Array instance
+                    elif isinstance(self[elem], Array):
+                        local_dict[elem] = self[elem].nda
+                    else:
+                        local_dict[elem] = self[elem]
+
+                # pre-allocated output buffer, if any. Lazy columns not
+                # computed yet (e.g. from a previous lazy call) are replaced,
+                # not forced
+                out_bufs[out_var] = None
+                out_col = out.get(out_var) if out is not None else None
+                if isinstance(out_col, Array) and not (
+                    isinstance(out_col, LazyArray) and not out_col.is_computed()
+                ):
+                    out_bufs[out_var] = out_col.nda
+
+            # blocks in the same layer do not depend on each other and can be
+            # evaluated concurrently
+            results = {}
+            if parallel and len(layer) > 1:
+                pool = _thread_pool(n_threads)
+                results = dict(
+                    zip(
+                        layer,
+                        pool.map(evaluate_block, layer, [out_bufs[v] for v in layer]),
+                    )
+                )
 
+            for out_var in layer:
+                out_buf = out_bufs[out_var]
+
+                # only one-dimensional results are deferred
+                probe = None
+                if lazy and out_buf is None:
+                    probe = evaluate_block(out_var, probe=True)
+
+                if out_var in results:
+                    out_data = results[out_var]
+                # on an empty table, the probe already is the result
+                elif probe is not None and self.size == 0:
+                    out_data = probe
+                elif probe is not None and np.ndim(probe) == 1:
+                    out_data = LazyArray(
+                        compute=partial(evaluate_block, out_var),
+                        shape=(self.size,),
+                        dtype=probe.dtype,
+                    )
+                else:
+                    out_data = evaluate_block(out_var, out_buf=out_buf)
 
-        Warning
-        -------
-        Blocks in `expr_config` must be ordered according to mutual dependency.
-        """
-        out_tbl = Table(size=self.size)
-        for out_var, spec in expr_config.items():
-            in_vars = {}
-            # Find all valid python variables in expression (e.g "a*b+sin(Cool)" --> ['a','b','sin','Cool'])
-            for elem in re.findall(r"\s*[A-Za-z_]\w*\s*", spec["expression"]):
-                elem = elem.strip()
-                if elem in self:  # check if the variable comes from dsp
-                    in_vars[elem] = self[elem]
-                elif (
-                    elem in out_tbl.keys()
-                ):  # if not try from previously processed data, else ignore since it is e.g sin func
-                    in_vars[elem] = out_tbl[elem]
+                # smart way to find right LGDO data type:
+
+                # the result is not computed yet
+                if isinstance(out_data, LazyArray):
+                    pass
 
+                # the result went into an existing column
+                elif out_buf is not None:
+                    out_data = out[out_var]
+
+                # out_data has one row and this row has a scalar (eg scalar product of two rows)
+                elif len(np.shape(out_data)) == 0:
+                    out_data = Array(nda=out_data)
+
+                # out_data has scalar in each row
+                elif len(np.shape(out_data)) == 1:
+                    out_data = Array(nda=out_data)
+
+                # out_data is  like
+                elif len(np.shape(out_data)) == 2:
+                    out_data = ArrayOfEqualSizedArrays(nda=out_data)
+
+                # higher order data (eg matrix product of ArrayOfEqualSizedArrays) not supported yet
                 else:
-                    continue
-                # get the nda if it is an Array instance
-                if isinstance(in_vars[elem], Array):
-                    in_vars[elem] = in_vars[elem].nda
-                # No vector of vectors support yet
-                elif isinstance(in_vars[elem], VectorOfVectors):
-                    raise TypeError("Data of type VectorOfVectors not supported (yet)")
-
-            out_data = ne.evaluate(
-                f"{spec['expression']}",
-                local_dict=dict(in_vars, **spec["parameters"])
-                if "parameters" in spec
-                else in_vars,
-            )  # Division is chosen by __future__.division in the interpreter
-
-            # smart way to find right LGDO data type:
-
-            # out_data has one row and this row has a scalar (eg scalar product of two rows)
-            if len(np.shape(out_data)) == 0:
-                out_data = Array(nda=out_data)
-
-            # out_data has scalar in each row
-            elif len(np.shape(out_data)) == 1:
-                out_data = Array(nda=out_data)
-
-            # out_data is  like
-            elif len(np.shape(out_data)) == 2:
-                out_data = ArrayOfEqualSizedArrays(nda=out_data)
-
-            # higher order data (eg matrix product of ArrayOfEqualSizedArrays) not supported yet
-            else:
-                ValueError(
-                    f"Calculation resulted in {len(np.shape(out_data))-1}-D row which is not supported yet"
-                )
+                    raise ValueError(
+                        f"Calculation resulted in {len(np.shape(out_data))-1}-D row which is not supported yet"
+                    )
+
+                out_cols[out_var] = out_data
+
+                # make the result available to the next expressions, unless a
+                # table column with the same name takes precedence
+                if out_var not in self:
+                    if isinstance(out_data, LazyArray):
+                        local_dict[out_var] = out_data
+                    else:
+                        local_dict[out_var] = out_data.nda
 
-            out_tbl.add_column(out_var, out_data)
+        if out is None:
+            out = Table(size=self.size)
+        for out_var in expr_config:
+            out.add_column(out_var, out_cols[out_var])
 
-        return out_tbl
+        return out
 
     def __str__(self):
         opts = fmt.get_dataframe_repr_params()
@@ -48,18 +48,18 @@ def load_aoe(
     params = ["A_max", "tp_0_est", "tp_99", "dt_eff", energy_param, cal_energy_param]
 
     table = sto.read_object(lh5_path, files)[0]
-    df = table.eval(cal_dict).get_dataframe()
+    out_tbl = table.eval(cal_dict)
 
     param_dict = {}
     for param in params:
         # add cuts in here
-        if param in df:
-            param_dict[param] = df[param].to_numpy()
+        if param in out_tbl:
+            param_dict[param] = out_tbl[param].nda
         else:
             param_dict.update(lh5.load_nda(files, [param], lh5_path))
-    if cut_field in df.keys():
+    if cut_field in out_tbl:
         for entry in param_dict:
-            param_dict[entry] = param_dict[entry][df[cut_field].to_numpy()]
+            param_dict[entry] = param_dict[entry][out_tbl[cut_field].nda]
 
     aoe = np.divide(param_dict["A_max"], param_dict[energy_param])
     return aoe, param_dict[cal_energy_param], param_dict["dt_eff"]
@@ -95,19 +95,19 @@ def load_data(
         sto = lh5.LH5Store()
         energy_dict = {"timestamp": df["timestamp"][ids].to_numpy()}
         table = sto.read_object(lh5_path, files)[0]
-        df = table.eval(hit_dict).get_dataframe()
+        out_tbl = table.eval(hit_dict)
         cut_parameters = cts.get_keys(table, cut_parameters)
 
         for param in energy_params:
-            if param in df:
-                energy_dict[param] = df[param][ids].to_numpy()
+            if param in out_tbl:
+                energy_dict[param] = out_tbl[param].nda[ids]
             else:
                 dat = lh5.load_nda(files, [param], lh5_path)[param]
                 energy_dict.update({param: dat[ids]})
         if cut_parameters is not None:
             for param in cut_parameters:
-                if param in df:
-                    energy_dict[param] = df[param][ids].to_numpy()
+                if param in out_tbl:
+                    energy_dict[param] = out_tbl[param].nda[ids]
                 else:
                     dat = lh5.load_nda(files, [param], lh5_path)[param]
                     energy_dict.update({param: dat[ids]})
@@ -32,7 +32,7 @@ class WaveformBrowser:
         lh5_group: str,
         base_path: str = "",
         entry_list: list[int] | list[list[int]] = None,
-        entry_mask: list[int] | list[list[int]] = None,
+        entry_mask: list[bool] | list[list[bool]] = None,
         dsp_config: str = None,
         database: str | dict = None,
         aux_values: pandas.DataFrame = None,
@@ -170,8 +170,8 @@ class WaveformBrowser:
             entries = []
             for i, f_entries in enumerate(self.lh5_it.entry_list):
                 entry_offset = self.lh5_it.file_map[i - 1] if i > 0 else 0
-                entries += [entry_offset + entry for entry in f_entries]
-            self.aux_vals = self.aux_vals.iloc[entries].reset_index()
+                entries.append(entry_offset + np.asarray(f_entries, dtype="int64"))
+            self.aux_vals = self.aux_vals.iloc[np.concatenate(entries)].reset_index()
 
         # initialize objects to draw: dict from name to list of 2DLines
         if isinstance(lines, str):
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+import pygama.lgdo as lgdo
+
+
+def test_datatype_name():
+    array = lgdo.LazyArray(lambda: np.zeros(3), shape=(3,), dtype=np.float64)
+    assert array.datatype_name() == "array"
+
+
+def test_form_datatype():
+    array = lgdo.LazyArray(lambda: np.zeros((3, 4)), shape=(3, 4), dtype=np.float64)
+    assert array.form_datatype() == "array<2>{real}"
+
+
+def test_init():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return np.array([1, 2, 3], dtype=np.int32)
+
+    attrs = {"attr1": 1}
+    array = lgdo.LazyArray(compute, shape=(3,), dtype=np.int32, attrs=attrs)
+    assert array.attrs == attrs | {"datatype": "array<1>{real}"}
+    assert len(array) == 3
+    assert not array.is_computed()
+    assert calls == []
+
+    assert (array.nda == np.array([1, 2, 3])).all()
+    assert (array.nda == np.array([1, 2, 3])).all()
+    assert array.is_computed()
+    assert calls == [1]
+
+
+def test_mismatch():
+    array = lgdo.LazyArray(lambda: np.zeros(4), shape=(3,), dtype=np.float64)
+    with pytest.raises(ValueError):
+        array.nda
+
+
+def test_resize():
+    array = lgdo.LazyArray(
+        lambda: np.array([1, 2, 3, 4]), shape=(4,), dtype=np.array([1]).dtype
+    )
+    array.resize(3)
+    assert len(array) == 3
+    assert (array.nda == np.array([1, 2, 3])).all()
@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -22,8 +24,19 @@ def test_init():
     tbl = Table(col_dict=col_dict)
     assert tbl.size == 4
 
+    tbl = Table(size=4, col_dict=col_dict)
+    assert tbl.size == 4
+
     tbl = Table(size=3, col_dict=col_dict)
     assert tbl.size == 3
+    assert len(tbl["a"]) == 3
+
+
+def test_slots():
+    tbl = Table(size=3, attrs={"a": 1})
+    assert not hasattr(tbl, "__dict__")
+    with pytest.raises(AttributeError):
+        tbl.foo = 1
 
 
 def test_datatype_name():
@@ -45,6 +58,15 @@ def test_is_full():
     assert tbl.is_full() is True
 
 
+def test_advance():
+    tbl = Table(size=5)
+    assert tbl.advance() is False
+    assert tbl.loc == 1
+    assert tbl.remaining() == 4
+    assert tbl.advance(4) is True
+    assert tbl.remaining() == 0
+
+
 def test_clear():
     tbl = Table()
     tbl.push_row()
@@ -57,6 +79,11 @@ def test_add_field():
     tbl.add_field("a", lgdo.Array(np.array([1, 2, 3])), use_obj_size=True)
     assert tbl.size == 3
 
+    tbl.add_field("b", lgdo.Array(np.array([1, 2, 3, 4, 5])))
+    assert tbl.size == 3
+    assert len(tbl["a"]) == 3
+    assert len(tbl["b"]) == 3
+
     with pytest.raises(TypeError):
         tbl.add_field("s", lgdo.Scalar(value=69))
 
@@ -82,6 +109,12 @@ def test_join():
 
     tbl2.join(tbl1, cols=("a"))
     assert list(tbl2.keys()) == ["c", "d", "a"]
+    assert tbl2.attrs["datatype"] == "table{c,d,a}"
+
+    tbl3 = Table(size=2)
+    tbl3.join(tbl2, cols=["c"])
+    assert tbl3.size == 2
+    assert (tbl3["c"].nda == [4, 5]).all()
 
 
 def test_get_dataframe():
@@ -107,6 +140,93 @@ def test_get_dataframe():
     df = tbl.get_dataframe()
     assert isinstance(df, pd.DataFrame)
     assert list(df.keys()) == ["a", "b", "c", "d_a", "d_b"]
+    assert not np.shares_memory(df["a"].to_numpy(), tbl["a"].nda)
+
+    df = tbl.get_dataframe(view=True)
+    assert list(df.keys()) == ["a", "b", "c", "d_a", "d_b"]
+    assert np.shares_memory(df["a"].to_numpy(), tbl["a"].nda)
+    assert np.shares_memory(df["d_a"].to_numpy(), tbl["d"]["a"].nda)
+
+
+def test_pickle():
+    tbl = Table(
+        col_dict={
+            "a": lgdo.Array(np.array([1, 2, 3, 4])),
+            "d": Table(col_dict={"x": lgdo.Array(np.array([1, 1, 1, 1]))}),
+        }
+    )
+    tbl.get_dataframe()
+    assert "a" in str(tbl)
+
+    tbl2 = pickle.loads(pickle.dumps(tbl))
+    assert list(tbl2.keys()) == ["a", "d"]
+    assert tbl2.size == 4
+    assert (tbl2["a"].nda == [1, 2, 3, 4]).all()
+    assert (tbl2["d"]["x"].nda == 1).all()
+
+
+def test_get_dataframe_obj_buf(tmp_path):
+    store = lgdo.LH5Store()
+    tbl = Table(col_dict={"a": lgdo.Array(np.arange(10)), "b": lgdo.Array(np.ones(10))})
+    store.write_object(tbl, "tbl", f"{tmp_path}/df_buf.lh5", wo_mode="overwrite_file")
+
+    buf, _ = store.read_object("tbl", f"{tmp_path}/df_buf.lh5", n_rows=2)
+    buf.get_dataframe()
+    assert "a" in str(buf)
+
+    # growing the buffer resizes the columns in place
+    buf, n_rows = store.read_object("tbl", f"{tmp_path}/df_buf.lh5", obj_buf=buf)
+    assert n_rows == 10
+    assert (buf.get_dataframe()["a"] == np.arange(10)).all()
+
+
+def test_get_dataframe_iterator(tmp_path):
+    store = lgdo.LH5Store()
+    tbl = Table(
+        col_dict={
+            "a": lgdo.Array(np.arange(10, dtype=np.uint16)),
+            "b": lgdo.Array(np.ones(10, dtype=np.float32)),
+        }
+    )
+    store.write_object(tbl, "tbl", f"{tmp_path}/df_it.lh5", wo_mode="overwrite_file")
+
+    # dataframes do not alias the re-used buffer
+    dfs = []
+    for buf, _, n_rows in lgdo.LH5Iterator(
+        f"{tmp_path}/df_it.lh5", "tbl", buffer_len=4
+    ):
+        dfs.append(buf.get_dataframe().iloc[:n_rows])
+    df = pd.concat(dfs)
+    assert (df["a"] == np.arange(10)).all()
+    assert df["a"].dtype == np.int64
+    assert df["b"].dtype == np.float64
+
+
+def test_to_ndarray():
+    tbl = Table(
+        col_dict={
+            "a": lgdo.Array(np.array([1, 2, 3, 4], dtype=np.int32)),
+            "b": lgdo.Array(np.array([5, 6, 7, 8], dtype=np.float32)),
+            "c": lgdo.Array(np.array([[1, 2], [3, 4], [5, 6], [7, 8]])),
+        }
+    )
+
+    data = tbl.to_dict_of_arrays()
+    assert list(data.keys()) == ["a", "b", "c"]
+    assert data["a"] is tbl["a"].nda
+
+    nda = tbl.to_ndarray(cols=["a", "b"])
+    assert nda.dtype == np.float64
+    assert nda.shape == (4, 2)
+    assert (nda[:, 1] == [5, 6, 7, 8]).all()
+
+    nda = tbl.to_ndarray(cols=["b", "a"], dtype=np.int64, order="F")
+    assert nda.dtype == np.int64
+    assert nda.flags.f_contiguous
+    assert (nda[2] == [7, 3]).all()
+
+    with pytest.raises(ValueError):
+        tbl.to_ndarray()
 
 
 def test_remove_column():
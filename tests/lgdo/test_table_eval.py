@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+import pytest
 
-from pygama.lgdo import Array, ArrayOfEqualSizedArrays, Table
+from pygama.lgdo import Array, ArrayOfEqualSizedArrays, LazyArray, Table
+from pygama.lgdo.table import _numexpr_programs, _thread_pool
 
 
 def test_eval_dependency():
@@ -94,3 +98,268 @@ def test_eval_math_functions():
         out_tbl["O2"].nda
         == np.array([[1, 2, 3, 4], [1, 2, 3, 4], [1, 2, 3, 4], [1, 2, 3, 4]])
     ).all()
+
+
+def test_eval_string_parameters():
+    obj = Table(
+        col_dict={
+            "a": Array(nda=np.array([1, 2, 3, 4], dtype=np.float32)),
+            "b": Array(nda=np.array([5, 6, 7, 8], dtype=np.float32)),
+        }
+    )
+
+    expr_config = {
+        "O1": {"expression": "p1 + p2 * a**2", "parameters": {"p1": "2", "p2": "3"}},
+        "O2": {"expression": "O1 - b"},
+    }
+
+    out_tbl = obj.eval(expr_config)
+    assert (out_tbl["O1"].nda == [5, 14, 29, 50]).all()
+    assert (out_tbl["O2"].nda == [0, 8, 22, 42]).all()
+
+
+def test_eval_unordered_dependency():
+    obj = Table(
+        col_dict={
+            "a": Array(nda=np.array([1, 2, 3, 4], dtype=np.float32)),
+            "b": Array(nda=np.array([5, 6, 7, 8], dtype=np.float32)),
+        }
+    )
+
+    expr_config = {
+        "O3": {"expression": "O2 * 2"},
+        "O2": {"expression": "O1 - b"},
+        "O1": {"expression": "a + b"},
+    }
+
+    out_tbl = obj.eval(expr_config)
+    assert list(out_tbl.keys()) == ["O3", "O2", "O1"]
+    assert (out_tbl["O1"].nda == [6, 8, 10, 12]).all()
+    assert (out_tbl["O2"].nda == [1, 2, 3, 4]).all()
+    assert (out_tbl["O3"].nda == [2, 4, 6, 8]).all()
+
+    with pytest.raises(ValueError):
+        obj.eval({"O1": {"expression": "O2 + a"}, "O2": {"expression": "O1 + b"}})
+
+
+def test_eval_numba_engine():
+    obj = Table(
+        col_dict={
+            "a": Array(nda=np.array([1, 2, 3, 4], dtype=np.float32)),
+            "b": Array(nda=np.array([5, 6, 7, 8], dtype=np.float32)),
+        }
+    )
+
+    expr_config = {
+        "O1": {"expression": "p1 + p2 * a**2", "parameters": {"p1": 2, "p2": 3}},
+        "O2": {"expression": "sqrt(O1 - b)"},
+        "O3": {"expression": "a > p1", "parameters": {"p1": 2}},
+    }
+
+    out_tbl = obj.eval(expr_config, engine="numba")
+    assert list(out_tbl.keys()) == ["O1", "O2", "O3"]
+    assert np.allclose(out_tbl["O1"].nda, [5, 14, 29, 50])
+    assert np.allclose(out_tbl["O2"].nda, np.sqrt([0, 8, 22, 42]))
+    assert (out_tbl["O3"].nda == [False, False, True, True]).all()
+
+    with pytest.raises(ValueError):
+        obj.eval(expr_config, engine="python")
+
+
+def test_eval_numba_injection(tmp_path):
+    obj = Table(col_dict={"a": Array(nda=np.array([1, 2, 3, 4], dtype=np.float32))})
+
+    bad_exprs = [
+        f"a\nopen('{tmp_path}/pwned', 'w').write('x')",
+        f"open('{tmp_path}/pwned', 'w')",
+        "__import__('os').getpid() + a",
+        "a.__class__",
+        "[a][0]",
+        "(lambda: a)()",
+        "save('x', a)",
+        "sqrt(a, out=a)",
+        "'x' + a",
+    ]
+    for expr in bad_exprs:
+        with pytest.raises(ValueError):
+            obj.eval({"O": {"expression": expr}}, engine="numba")
+    assert not (tmp_path / "pwned").exists()
+
+    with pytest.raises(ValueError):
+        obj.eval(
+            {"O": {"expression": "a", "parameters": {"b=print('x')": 1}}},
+            engine="numba",
+        )
+
+    out_tbl = obj.eval({"O": {"expression": "-a * pi + abs(a)"}}, engine="numba")
+    assert np.allclose(out_tbl["O"].nda, (1 - np.pi) * np.array([1, 2, 3, 4]))
+
+
+def test_eval_out_table():
+    obj = Table(
+        col_dict={
+            "a": Array(nda=np.array([1, 2, 3, 4], dtype=np.float32)),
+            "b": Array(nda=np.array([5, 6, 7, 8], dtype=np.float32)),
+        }
+    )
+
+    expr_config = {
+        "O1": {"expression": "a + b"},
+        "O2": {"expression": "O1 * b"},
+    }
+
+    out_tbl = obj.eval(expr_config)
+    buf = out_tbl["O1"].nda
+
+    obj["a"].nda[:] = [0, 0, 0, 0]
+    for engine in ["numexpr", "numba"]:
+        assert obj.eval(expr_config, engine=engine, out=out_tbl) is out_tbl
+        assert out_tbl["O1"].nda is buf
+        assert (out_tbl["O1"].nda == [5, 6, 7, 8]).all()
+        assert (out_tbl["O2"].nda == [25, 36, 49, 64]).all()
+
+    with pytest.raises(ValueError):
+        obj.eval(expr_config, out=Table(size=2))
+
+
+def test_eval_lazy():
+    obj = Table(
+        col_dict={
+            "a": Array(nda=np.array([1, 2, 3, 4], dtype=np.float32)),
+            "b": Array(nda=np.array([5, 6, 7, 8], dtype=np.float32)),
+            "c": ArrayOfEqualSizedArrays(
+                nda=np.array(
+                    [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16]],
+                    dtype=np.float32,
+                )
+            ),
+        }
+    )
+
+    expr_config = {
+        "O1": {"expression": "p1 + p2 * a**2", "parameters": {"p1": 2, "p2": 3}},
+        "O2": {"expression": "O1 - b"},
+        "O3": {"expression": "a > p1", "parameters": {"p1": 2}},
+        "O4": {"expression": "c * 2"},
+    }
+
+    out_tbl = obj.eval(expr_config, lazy=True)
+    assert list(out_tbl.keys()) == ["O1", "O2", "O3", "O4"]
+    assert all(isinstance(out_tbl[k], LazyArray) for k in ["O1", "O2", "O3"])
+    assert isinstance(out_tbl["O4"], ArrayOfEqualSizedArrays)
+    assert not out_tbl["O1"].is_computed()
+    assert out_tbl["O3"].attrs["datatype"] == "array<1>{bool}"
+
+    assert (out_tbl["O2"].nda == [0, 8, 22, 42]).all()
+    assert out_tbl["O1"].is_computed()
+    assert not out_tbl["O3"].is_computed()
+    assert (out_tbl["O3"].nda == [False, False, True, True]).all()
+
+
+def test_eval_lazy_out_table():
+    obj = Table(col_dict={"a": Array(nda=np.array([1, 2, 3, 4], dtype=np.float32))})
+    expr_config = {"O1": {"expression": "a * 2"}, "O2": {"expression": "a + 1"}}
+
+    out_tbl = obj.eval(expr_config, lazy=True)
+    assert (out_tbl["O2"].nda == [2, 3, 4, 5]).all()
+    o2_buf = out_tbl["O2"].nda
+    old_o1 = out_tbl["O1"]
+
+    # re-fill the input and evaluate again into the same table
+    obj["a"].nda[:] = [5, 6, 7, 8]
+    assert obj.eval(expr_config, out=out_tbl, lazy=True) is out_tbl
+
+    # the unused result of the previous call is not forced, but replaced
+    assert not old_o1.is_computed()
+    assert isinstance(out_tbl["O1"], LazyArray)
+    assert not out_tbl["O1"].is_computed()
+    assert (out_tbl["O1"].nda == [10, 12, 14, 16]).all()
+
+    # computed columns are re-used as buffers
+    assert (out_tbl["O2"].nda == [6, 7, 8, 9]).all()
+    assert out_tbl["O2"].nda is o2_buf
+
+
+def test_eval_empty():
+    obj = Table(
+        col_dict={
+            "a": Array(nda=np.array([], dtype=np.float32)),
+            "b": Array(nda=np.array([], dtype=np.float32)),
+        }
+    )
+
+    expr_config = {
+        "O1": {"expression": "a + b"},
+        "O2": {"expression": "O1 > p1", "parameters": {"p1": 2}},
+    }
+
+    for lazy in [False, True]:
+        out_tbl = obj.eval(expr_config, lazy=lazy)
+        assert out_tbl.size == 0
+        assert type(out_tbl["O1"]) is Array
+        assert out_tbl["O1"].nda.dtype == np.float32
+        assert out_tbl["O2"].nda.dtype == np.bool_
+
+
+def test_eval_compile_cache():
+    obj = Table(col_dict={"a": Array(nda=np.array([1, 2, 3, 4], dtype=np.float32))})
+    expr_config = {"O1": {"expression": "p1 * a + 1", "parameters": {"p1": 3}}}
+
+    obj.eval(expr_config)
+    hits = _numexpr_programs().cache_info().hits
+    out_tbl = obj.eval(expr_config)
+    assert _numexpr_programs().cache_info().hits == hits + 1
+    assert (out_tbl["O1"].nda == [4, 7, 10, 13]).all()
+
+
+def test_eval_concurrent_calls():
+    obj = Table(
+        col_dict={
+            "a": Array(nda=np.linspace(0, 1, 100000)),
+            "b": Array(nda=np.linspace(1, 2, 100000)),
+        }
+    )
+    expr_config = {"O": {"expression": "sin(a)*exp(b) + a*b - (a+b)**2"}}
+    expected = obj.eval(expr_config)["O"].nda
+
+    def run(_):
+        return all(
+            np.array_equal(obj.eval(expr_config)["O"].nda, expected) for _ in range(20)
+        )
+
+    # each thread compiles and runs its own program
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(run, range(8)))
+
+
+def test_eval_threads():
+    obj = Table(
+        col_dict={
+            "a": Array(nda=np.linspace(0, 1, 20000)),
+            "b": Array(nda=np.linspace(1, 2, 20000)),
+        }
+    )
+    expr_config = {
+        "O1": {"expression": "a + b"},
+        "O2": {"expression": "a * b"},
+        "O3": {"expression": "O1 - O2"},
+    }
+    # identical blocks in the same layer run concurrently
+    for i in range(8):
+        expr_config[f"S{i}"] = {"expression": "sin(a)*exp(b) + a*b - (a+b)**2"}
+
+    serial = obj.eval(expr_config)
+    for _ in range(3):
+        threaded = obj.eval(expr_config, n_threads=4)
+        assert list(threaded.keys()) == list(expr_config.keys())
+        for col in expr_config:
+            assert np.array_equal(threaded[col].nda, serial[col].nda)
+
+    out_tbl = obj.eval(expr_config, out=threaded, n_threads=2)
+    assert out_tbl is threaded
+    for col in expr_config:
+        assert np.array_equal(out_tbl[col].nda, serial[col].nda)
+
+    # a single pool is kept, with the last number of threads
+    assert _thread_pool(2) is _thread_pool(2)
+    assert _thread_pool(3) is not _thread_pool(2)
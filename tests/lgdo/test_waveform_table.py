@@ -61,3 +61,14 @@ def test_init():
 
     wft = WaveformTable(t0=[1, 1, 1], dt=[2, 2, 2], wf_len=1000, dtype=np.float32)
     assert wft.values.nda.dtype == np.float32
+
+
+def test_resize():
+    wft = WaveformTable(size=3, values=np.zeros((3, 5)))
+    wft.resize()
+    assert len(wft) == 3
+
+    wft.resize(5)
+    assert len(wft) == 5
+    assert len(wft.values) == 5
+    assert len(wft.t0) == 5
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import numpy as np
+
 from pygama.vis import WaveformBrowser
 
 config_dir = Path(__file__).parent / "configs"
@@ -24,30 +26,44 @@ def test_basics(lgnd_test_data):
 
 
 def test_entry_mask(lgnd_test_data):
+    entries = [
+        7,
+        9,
+        25,
+        27,
+        33,
+        38,
+        46,
+        52,
+        57,
+        59,
+        67,
+        71,
+        72,
+        82,
+        90,
+        92,
+        93,
+        94,
+        97,
+    ]
+
+    wb = WaveformBrowser(
+        lgnd_test_data.get_path("lh5/LDQTA_r117_20200110T105115Z_cal_geds_raw.lh5"),
+        "/geds/raw",
+        entry_list=entries,
+    )
+
+    wb.draw_next()
+
+    selection = np.zeros(100, dtype=bool)
+    selection[entries] = True
+
     wb = WaveformBrowser(
         lgnd_test_data.get_path("lh5/LDQTA_r117_20200110T105115Z_cal_geds_raw.lh5"),
         "/geds/raw",
-        entry_list=[
-            7,
-            9,
-            25,
-            27,
-            33,
-            38,
-            46,
-            52,
-            57,
-            59,
-            67,
-            71,
-            72,
-            82,
-            90,
-            92,
-            93,
-            94,
-            97,
-        ],
+        entry_mask=selection,
     )
 
+    assert (wb.lh5_it.entry_list[0] == entries).all()
     wb.draw_next()